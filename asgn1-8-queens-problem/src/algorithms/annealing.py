@@ -0,0 +1,89 @@
+from __future__ import annotations
+from typing import List, Tuple, Dict, Optional
+import numpy as np
+from src.core.heuristic import Board
+from src.core.population import Population, conflict_counts, attacking_pairs_batch, run_islands
+
+
+def anneal_island(boards: Population, temperature: float, cooling: float, steps: int,
+                  seed: np.random.SeedSequence) -> Tuple[Population, List[int]]:
+    """
+    Run a batch of simulated annealing chains (one board per array row) for a number of steps.
+
+    Every step, each chain proposes moving the queen of one random row to another column.
+    The change in attacking pairs is read from the column / diagonal counts, so a step costs
+    O(chains) instead of O(chains * n^2). Worse moves are accepted with probability exp(-delta / T),
+    and T is multiplied by cooling after every step. Chains at h == 0 stop moving.
+
+    Return values:
+    - (boards, best h of every step), stops early once a chain reaches h == 0
+    """
+    rng = np.random.default_rng(seed)
+    boards = boards.copy()
+    chains, n = boards.shape
+    cols, diags, antis = conflict_counts(boards)
+    h = attacking_pairs_batch(boards)
+    chain_ids = np.arange(chains)
+    history: List[int] = []
+
+    for _ in range(steps):
+        if h.min() == 0:
+            break
+        rows = rng.integers(0, n, size=chains)
+        old = boards[chain_ids, rows]
+        new = rng.integers(0, n - 1, size=chains, dtype=np.int32)
+        new += new >= old  # never propose the current column
+
+        removed = (cols[chain_ids, old] - 1) + (diags[chain_ids, rows + old] - 1) \
+            + (antis[chain_ids, old - rows + n - 1] - 1)
+        added = cols[chain_ids, new] + diags[chain_ids, rows + new] \
+            + antis[chain_ids, new - rows + n - 1]
+        delta = added - removed
+
+        with np.errstate(over="ignore"):
+            accept = (delta <= 0) | (rng.random(chains) < np.exp(-delta / max(temperature, 1e-12)))
+        accept &= h > 0
+
+        ids, r, o, c = chain_ids[accept], rows[accept], old[accept], new[accept]
+        cols[ids, o] -= 1
+        diags[ids, r + o] -= 1
+        antis[ids, o - r + n - 1] -= 1
+        cols[ids, c] += 1
+        diags[ids, r + c] += 1
+        antis[ids, c - r + n - 1] += 1
+        boards[ids, r] = c
+        h[accept] += delta[accept]
+
+        temperature *= cooling
+        history.append(int(h.min()))
+
+    return boards, history
+
+
+def parallel_annealing(n: int = 8,
+                       chains: int = 64,
+                       islands: int = 4,
+                       steps: int = 20000,
+                       exchange_interval: int = 500,
+                       migrants: int = 2,
+                       temperature: float = 2.0,
+                       cooling: float = 0.9995,
+                       workers: Optional[int] = None,
+                       seed: Optional[int] = None,
+                       deadline: Optional[float] = None) -> Tuple[Optional[Board], Dict]:
+    """
+    Parallel simulated annealing for the N-Queens problem
+
+    Every island runs a batch of chains in a process pool for exchange_interval steps,
+    then the best chains of each island replace the worst chains of the next island (ring).
+    The temperature follows one global schedule: T = temperature * cooling ** step.
+    - workers = 1 runs the islands in this process (no pool)
+    - deadline = wall-clock budget in seconds, checked between exchanges
+
+    Return values: see run_islands, the stats count steps
+    (steps, steps_per_sec, best_h_per_step), evaluations_per_sec is proposed moves per second.
+    """
+    return run_islands(anneal_island,
+                       lambda done, epoch: (temperature * cooling ** done, cooling, epoch),
+                       n, chains, islands, steps, exchange_interval, migrants,
+                       unit="step", workers=workers, seed=seed, deadline=deadline)
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import List, Tuple, Dict, Optional, Set
+from typing import List, Tuple, Dict, Optional, Set, Sequence
 import heapq
+import time
 from src.core.heuristic import attacking_pairs
 
 board_size = 8
@@ -46,7 +47,9 @@ def reconstruct_path(parent: Dict[Tuple[int, ...], Tuple[int, ...]],
     return path
 
 
-def a_star(initial: Board, max_expansions: int = 100000) -> Tuple[Optional[List[Board]], int]:
+def a_star(initial: Board, max_expansions: int = 100000,
+           deadline: Optional[float] = None,
+           h_cache: Optional[Dict[Tuple[int, ...], int]] = None) -> Tuple[Optional[List[Board]], int]:
     """
     A* search for the N-Queens problem 
 
@@ -56,10 +59,16 @@ def a_star(initial: Board, max_expansions: int = 100000) -> Tuple[Optional[List[
 
     Goal: a board where attacking_pairs(board) == 0
 
+    - deadline = wall-clock budget in seconds (None means no time limit)
+    - h_cache = optional dict of heuristic values already computed, filled in as the search goes
+
     Return values:
     - (solution_board, expansions (total states expanded)) if a solution is found
-    - (None, expansions) if no solution is found within max_expansions
+    - (None, expansions) if no solution is found within max_expansions or the deadline
     """
+    stop_at = None if deadline is None else time.monotonic() + deadline
+    if h_cache is None:
+        h_cache = {}
     start = tuple(initial)
 
     def is_goal(board: Board) -> bool:
@@ -82,13 +91,15 @@ def a_star(initial: Board, max_expansions: int = 100000) -> Tuple[Optional[List[
     expansions = 0
 
     while frontier and expansions < max_expansions:
+        if stop_at is not None and time.monotonic() >= stop_at:
+            break
         f, g, cur = heapq.heappop(frontier)
         if cur in closed:
             continue
         closed.add(cur)
 
         cur_list = list(cur)
-        if attacking_pairs(cur_list) == 0:
+        if is_goal(cur_list):
             path = reconstruct_path(parent, cur)
             return path, expansions
 
@@ -102,8 +113,159 @@ def a_star(initial: Board, max_expansions: int = 100000) -> Tuple[Optional[List[
             if tentative_g < g_cost.get(neighbor_tuple, float("inf")):
                 parent[neighbor_tuple] = cur
                 g_cost[neighbor_tuple] = tentative_g
-                h = attacking_pairs(neighbor)
+                if neighbor_tuple not in h_cache:
+                    h_cache[neighbor_tuple] = attacking_pairs(neighbor)
+                h = h_cache[neighbor_tuple]
                 heapq.heappush(frontier, (tentative_g + h,
                                tentative_g, neighbor_tuple))
 
     return None, expansions
+
+
+def moves_lower_bound(board: Board, h: int) -> int:
+    """Admissible estimate of the moves left to a goal.
+    attacking_pairs itself is not admissible, one move changes a single row and so removes at most
+    board_size - 1 attacking pairs (the pairs of that row's queen). Every empty row also needs a move.
+    """
+    return max(-(-h // (board_size - 1)), sum(1 for c in board if c < 0))
+
+
+def anytime_a_star(initial: Board,
+                   deadline: Optional[float] = None,
+                   weights: Sequence[float] = (3.0, 2.0, 1.5, 1.2),
+                   max_expansions: int = 100000) -> Tuple[Optional[List[Board]], int, float]:
+    """
+    Anytime weighted A* (ARA*) for the N-Queens problem
+
+    The evaluation function would be: f = g + w * h, with w taken from weights in order.
+    A large w finds a solution quickly, then every later pass lowers w and improves the
+    current solution, reusing g costs, parents and the frontier from the previous pass.
+    h is not consistent, so a state whose g improves is expanded again, and a pass stops
+    once nothing left in the frontier would be popped before the best goal found so far.
+
+    The last pass (w = 1.0) is a_star itself, reusing the cached heuristic values and the
+    remaining budget. h is not admissible either, so the plain A* order can still beat the
+    weighted passes, and taking the shorter of the two paths means the result is never
+    worse than a_star when the deadline allows the last pass to finish.
+
+    - deadline = wall-clock budget in seconds (None means no time limit)
+    - bound = suboptimality bound of the returned path, cost <= bound * optimal cost.
+      It is measured against moves_lower_bound (admissible), not against h, so it
+      stays above 1.0 unless the path is proven optimal.
+
+    Return values:
+    - (path, expansions, bound) with the best path found before the deadline
+    - (None, expansions, inf) only if no solution was found at all
+    """
+    stop_at = None if deadline is None else time.monotonic() + deadline
+    start = tuple(initial)
+
+    def is_goal(board: Tuple[int, ...], h: int) -> bool:
+        return h == 0 and all(c >= 0 for c in board)
+
+    heuristic_start = attacking_pairs(initial)
+    if is_goal(start, heuristic_start):
+        return [initial], 0, 1.0
+
+    parent: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+    g_cost: Dict[Tuple[int, ...], int] = {start: 0}
+    h_cost: Dict[Tuple[int, ...], int] = {start: heuristic_start}
+
+    # best solution so far (incumbent), goals are accepted as soon as they are generated
+    best_goal: Optional[Tuple[int, ...]] = None
+    best_g = float("inf")
+
+    # states not yet expanded with their current g, re-keyed into a new heap every pass
+    open_set: Set[Tuple[int, ...]] = {start}
+    expansions = 0
+
+    def current_bound(path: List[Board]) -> float:
+        # an optimal path either still goes through a state of open_set with its correct g,
+        # or was fully expanded and its goal already has g = optimal cost
+        lower = min((g_cost[s] + moves_lower_bound(list(s), h_cost[s]) for s in open_set),
+                    default=best_g)
+        lower = min(lower, best_g)
+        if lower <= 0:
+            return 1.0 if len(path) == 1 else float("inf")
+        return max(1.0, (len(path) - 1) / lower)
+
+    for w in weights:
+        frontier: List[Tuple[float, int, Tuple[int, ...]]] = [
+            (g_cost[s] + w * h_cost[s], g_cost[s], s) for s in open_set]
+        heapq.heapify(frontier)
+
+        # a_star stops when the goal is popped, goals have f = g, and ties on f pop the smaller g
+        # first, so keep expanding while (f, g) is below (best_g, best_g)
+        while frontier and (frontier[0][0], frontier[0][1]) < (best_g, best_g):
+            if expansions >= max_expansions or (stop_at is not None and time.monotonic() >= stop_at):
+                if best_goal is None:
+                    return None, expansions, float("inf")
+                path = reconstruct_path(parent, best_goal)
+                return path, expansions, current_bound(path)
+
+            f, g, cur = heapq.heappop(frontier)
+            if cur not in open_set or g != g_cost[cur]:
+                continue  # stale entry
+            open_set.discard(cur)
+            expansions += 1
+
+            for neighbor in neighbors(list(cur)):
+                neighbor_tuple = tuple(neighbor)
+                tentative_g = g + 1
+                if tentative_g >= g_cost.get(neighbor_tuple, float("inf")):
+                    continue
+                parent[neighbor_tuple] = cur
+                g_cost[neighbor_tuple] = tentative_g
+                if neighbor_tuple not in h_cost:
+                    h_cost[neighbor_tuple] = attacking_pairs(neighbor)
+                h = h_cost[neighbor_tuple]
+
+                if is_goal(neighbor_tuple, h):
+                    if tentative_g < best_g:
+                        best_goal, best_g = neighbor_tuple, tentative_g
+                    continue
+                # h is inconsistent, so a cheaper g reopens the state even if it was expanded
+                open_set.add(neighbor_tuple)
+                heapq.heappush(frontier, (tentative_g + w * h,
+                               tentative_g, neighbor_tuple))
+
+    best_path = reconstruct_path(parent, best_goal) if best_goal is not None else None
+
+    # last pass, plain A* (w = 1.0) on the rest of the budget
+    remaining = None if stop_at is None else max(0.0, stop_at - time.monotonic())
+    path, used = a_star(initial, max_expansions - expansions, remaining, h_cost)
+    expansions += used
+    if path is not None and (best_path is None or len(path) < len(best_path)):
+        best_path = path
+
+    if best_path is None:
+        return None, expansions, float("inf")
+    return best_path, expansions, current_bound(best_path)
+
+
+if __name__ == "__main__":
+    # Check anytime_a_star on random boards: the result is a solution, never longer than a_star,
+    # and the reported bound holds against the true optimum (fewest rows to change to reach one
+    # of the 92 solutions, an empty row always counts as a change). Partial boards are included.
+    import random
+    from itertools import permutations
+
+    solutions = [list(p) for p in permutations(range(board_size)) if attacking_pairs(list(p)) == 0]
+    random.seed(0)
+    boards = [[random.randrange(board_size) for _ in range(board_size)] for _ in range(60)]
+    for board in boards[:20]:
+        board = board.copy()
+        for row in random.sample(range(board_size), random.randint(1, 3)):
+            board[row] = -1
+        boards.append(board)
+    boards.append([-1, 4, 7, 5, 2, 6, 1, 3])  # one empty row, h == 0 but not a solution
+    for board in boards:
+        optimal = min(sum(a != b for a, b in zip(board, s)) for s in solutions)
+        plain, _ = a_star(board)
+        path, expansions, bound = anytime_a_star(board, deadline=5)
+        cost = len(path) - 1
+        assert min(path[-1]) >= 0 and attacking_pairs(path[-1]) == 0, (board, path[-1])
+        assert bound >= 1.0, (board, bound)
+        assert plain is None or cost <= len(plain) - 1, (board, cost, len(plain) - 1)
+        assert cost <= bound * optimal + 1e-9, (board, cost, optimal, bound)
+        print(f"{board}  optimal={optimal}  a_star={plain and len(plain) - 1}  anytime={cost}  bound={bound:.2f}")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+from typing import List, Tuple, Dict, Optional
+import numpy as np
+from src.core.heuristic import Board
+from src.core.population import Population, attacking_pairs_batch, run_islands
+
+
+def evolve_island(population: Population, generations: int, mutation_rate: float,
+                  elite: int, seed: np.random.SeedSequence) -> Tuple[Population, List[int]]:
+    """
+    Run one island of the genetic algorithm for a number of generations.
+
+    Every generation is done on the whole population array at once:
+    - tournament selection of size 2 on h = attacking_pairs
+    - one-point crossover (the child takes the rows before the cut from parent 1, the rest from parent 2)
+    - mutation, every row gets a new random column with probability mutation_rate
+    - the elite best boards are copied unchanged
+
+    Return values:
+    - (population, best h of every generation), stops early once a board with h == 0 appears
+    """
+    rng = np.random.default_rng(seed)
+    size, n = population.shape
+    fitness = attacking_pairs_batch(population)
+    history: List[int] = []
+
+    for _ in range(generations):
+        if fitness.min() == 0:
+            break
+        order = np.argsort(fitness, kind="stable")
+        elites = population[order[:elite]]
+
+        # tournament selection, two contenders per parent slot
+        contenders = rng.integers(0, size, size=(2, size, 2))
+        picks = np.where(fitness[contenders[..., 0]] <= fitness[contenders[..., 1]],
+                         contenders[..., 0], contenders[..., 1])
+        parent1, parent2 = population[picks[0]], population[picks[1]]
+
+        # one-point crossover
+        cuts = rng.integers(1, n, size=(size, 1))
+        children = np.where(np.arange(n) < cuts, parent1, parent2)
+
+        # mutation
+        mutate = rng.random((size, n)) < mutation_rate
+        children[mutate] = rng.integers(0, n, size=int(mutate.sum()), dtype=np.int32)
+
+        children[:elite] = elites
+        population = np.ascontiguousarray(children, dtype=np.int32)
+        fitness = attacking_pairs_batch(population)
+        history.append(int(fitness.min()))
+
+    return population, history
+
+
+def genetic_algorithm(n: int = 8,
+                      population_size: int = 200,
+                      islands: int = 4,
+                      generations: int = 1000,
+                      migration_interval: int = 20,
+                      migrants: int = 2,
+                      mutation_rate: Optional[float] = None,
+                      elite: int = 2,
+                      workers: Optional[int] = None,
+                      seed: Optional[int] = None,
+                      deadline: Optional[float] = None) -> Tuple[Optional[Board], Dict]:
+    """
+    Island-model genetic algorithm for the N-Queens problem
+
+    Every island evolves its own population in a process pool for migration_interval generations,
+    then the best migrants of each island replace the worst boards of the next island (ring).
+    - mutation_rate defaults to 1 / n
+    - workers = 1 runs the islands in this process (no pool)
+    - deadline = wall-clock budget in seconds, checked between migrations
+
+    Return values: see run_islands, the stats count generations
+    (generations, generations_per_sec, best_h_per_generation).
+    """
+    if mutation_rate is None:
+        mutation_rate = 1.0 / n
+    return run_islands(evolve_island, lambda done, epoch: (epoch, mutation_rate, elite),
+                       n, population_size, islands, generations, migration_interval, migrants,
+                       unit="generation", workers=workers, seed=seed, deadline=deadline)
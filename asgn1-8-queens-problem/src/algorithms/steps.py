@@ -0,0 +1,180 @@
+# Step traces for the visualizations, kept free of GUI imports
+
+from typing import List
+
+from src.core.heuristic import attacking_pairs
+from src.algorithms.astar import a_star
+
+
+# ----------------------------- A* (row-level, compact) ------------------------
+def steps_from_astar(start_state: List[int]) -> List[dict]:
+    path, *_ = a_star(start_state)  # accept either 2-tuple or 3-tuple
+    if not path:
+        return [{
+            "type": "error", "state": start_state.copy(), "row": -1, "col": -1,
+            "h": attacking_pairs(start_state)
+        }]
+
+    n = len(path[0])
+    shown = path[0].copy()  # show initial state fully
+    steps: List[dict] = []
+
+    steps.append({"type": "start", "state": shown.copy(), "row": -1, "col": -1,
+                  "h": attacking_pairs(path[0])})
+
+    for i in range(1, len(path)):
+        prev_board, cur_board = path[i - 1], path[i]
+        diffs = [r for r in range(n) if cur_board[r] != prev_board[r]]
+        if not diffs:
+            continue
+        for r in diffs:
+            shown[r] = cur_board[r]
+            steps.append({
+                "type": "move",
+                "state": shown.copy(),
+                "row": r,
+                "col": cur_board[r],
+                "h": attacking_pairs(cur_board),
+            })
+
+    steps.append({"type": "done", "state": shown.copy(),
+                 "row": -1, "col": -1, "h": 0})
+    return steps
+
+
+# ----------------------------- A* (per-cell, detailed) ------------------------
+def steps_from_astar_per_cell(start_state: List[int]) -> List[dict]:
+    # Use the path returned by a_star, ignore any extra returns safely
+    result = a_star(start_state)
+    path = result[0] if result else []
+
+    if not path:
+        return [{
+            "type": "error", "state": start_state.copy(), "row": -1, "col": -1,
+            "h": attacking_pairs(start_state)
+        }]
+
+    n = len(path[0])
+    shown = path[0].copy()
+    steps: List[dict] = []
+    steps.append({"type": "start", "state": shown.copy(), "row": -1, "col": -1,
+                  "h": attacking_pairs(path[0])})
+
+    for i in range(1, len(path)):
+        prev_board, cur_board = path[i - 1], path[i]
+        diffs = [row for row in range(n) if cur_board[row] != prev_board[row]]
+        if not diffs:
+            continue
+
+        for row in diffs:
+            target_col = cur_board[row]
+            # sweep previews across the row
+            for col in range(n):
+                temp = shown.copy()
+                temp[row] = col
+                steps.append({
+                    "type": "discover",
+                    "state": temp,
+                    "row": row,
+                    "col": col,
+                    "h": attacking_pairs(cur_board),
+                    "g": None,
+                    "f": None,
+                })
+            # commit
+            shown[row] = target_col
+            steps.append({
+                "type": "expand",
+                "state": shown.copy(),
+                "row": row,
+                "col": target_col,
+                "h": attacking_pairs(cur_board),
+                "g": None,
+                "f": None,
+            })
+
+    steps.append({"type": "done", "state": shown.copy(),
+                 "row": -1, "col": -1, "h": 0})
+    return steps
+
+
+# ----------------------------- Backtracking (verbose) -------------------------
+def steps_from_backtracking(start_state: List[int]) -> List[dict]:
+    """
+    start_state may contain -1 for empty rows.
+    Honors fixed queens, fills the rest. Logs try/place/conflict/backtrack/done.
+    """
+    n = len(start_state)
+    board = start_state.copy()
+    steps: List[dict] = []
+
+    def is_safe(rows: int, cols: int) -> bool:
+        if cols == -1:
+            return False
+        for row in range(n):
+            col = board[row]
+            if row == rows:
+                continue  # skip the same row
+            if col == -1:
+                continue
+            if cols == col:
+                return False  # same column
+            if abs(rows - row) == abs(cols - col):
+                return False  # same diagonal
+        return True
+
+    # validate pre-placed queens
+    for row in range(n):
+        col = board[row]
+        if col != -1 and not is_safe(row, col):
+            steps.append({"type": "error", "state": board.copy(), "row": row, "col": col,
+                          "h": attacking_pairs(board)})
+            return steps
+
+    steps.append({"type": "start", "state": board.copy(), "row": -1, "col": -1,
+                  "h": attacking_pairs(board)})
+
+    def next_empty_row(from_row: int) -> int:
+        for rr in range(from_row, n):
+            if board[rr] == -1:
+                return rr
+        return n
+
+    def place_from(row_index: int) -> bool:
+        row = next_empty_row(row_index)
+        if row >= n:
+            steps.append({"type": "done", "state": board.copy(),
+                         "row": -1, "col": -1, "h": 0})
+            return True
+
+        for col in range(n):
+            steps.append({"type": "try", "state": board.copy(), "row": row, "col": col,
+                          "h": attacking_pairs(board)})
+            if is_safe(row, col):
+                board[row] = col
+                steps.append({"type": "place", "state": board.copy(), "row": row, "col": col,
+                              "h": attacking_pairs(board)})
+                if place_from(row + 1):
+                    return True
+                board[row] = -1
+                steps.append({"type": "backtrack", "state": board.copy(), "row": row, "col": col,
+                              "h": attacking_pairs(board)})
+            else:
+                steps.append({"type": "conflict", "state": board.copy(), "row": row, "col": col,
+                              "h": attacking_pairs(board)})
+        return False
+
+    place_from(0)
+    return steps
+
+
+# ------------------------ Backtracking (row-level, compact) -------------------
+def steps_from_backtracking_compact(start_state: List[int]) -> List[dict]:
+    verbose = steps_from_backtracking(start_state)
+    if not verbose:
+        return verbose
+    steps = [verbose[0]]  # keep 'start'
+    for s in verbose[1:]:
+        if s["type"] in ("place", "backtrack", "done", "error"):
+            steps.append(s)
+    return steps
@@ -0,0 +1,146 @@
+# Array-backed populations of boards for the stochastic solvers
+
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import time
+import numpy as np
+
+from src.core.heuristic import Board
+
+# population[i, row] = column of the queen in that row of board i (one contiguous int32 block)
+Population = np.ndarray
+
+
+def random_population(size: int, n: int, rng: np.random.Generator) -> Population:
+    """Return size random complete boards of an n x n chessboard, one board per array row."""
+    return rng.integers(0, n, size=(size, n), dtype=np.int32)
+
+
+def conflict_counts(population: Population) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Count the queens on every column, diagonal (row + col) and anti-diagonal (col - row + n - 1)
+    of every board. Returns three arrays of shape (size, n), (size, 2n - 1) and (size, 2n - 1).
+    """
+    size, n = population.shape
+    rows = np.arange(n, dtype=np.int32)
+    offsets = np.arange(size, dtype=np.int64)[:, None]
+
+    def count(keys: np.ndarray, width: int) -> np.ndarray:
+        flat = (offsets * width + keys).ravel()
+        return np.bincount(flat, minlength=size * width).reshape(size, width)
+
+    cols = count(population, n)
+    diags = count(population + rows, 2 * n - 1)
+    antis = count(population - rows + n - 1, 2 * n - 1)
+    return cols, diags, antis
+
+
+def attacking_pairs_batch(population: Population) -> np.ndarray:
+    """Return attacking_pairs() of every board in the population.
+    k queens sharing a column or a diagonal make k * (k - 1) / 2 attacking pairs,
+    which is the same pair count as the row-by-row loop in heuristic.py.
+    """
+    total = np.zeros(population.shape[0], dtype=np.int64)
+    for counts in conflict_counts(population):
+        total += (counts * (counts - 1) // 2).sum(axis=1)
+    return total
+
+
+def migrate_ring(islands: List[Population], fitness: List[np.ndarray], migrants: int) -> None:
+    """Copy the best migrants boards of island i over the worst boards of island i + 1 (in place)."""
+    if migrants <= 0 or len(islands) < 2:
+        return
+    # snapshot the migrants and their h before any island is overwritten
+    best = []
+    for island, h in zip(islands, fitness):
+        order = np.argsort(h, kind="stable")[:migrants]
+        best.append((island[order].copy(), h[order].copy()))
+    for i, island in enumerate(islands):
+        boards, h = best[(i - 1) % len(islands)]
+        worst = np.argsort(fitness[i], kind="stable")[-migrants:]
+        island[worst] = boards
+        fitness[i][worst] = h
+
+
+def run_islands(island_fn: Callable[..., Tuple[Population, List[int]]],
+                epoch_args: Callable[[int, int], tuple],
+                n: int,
+                size: int,
+                islands: int,
+                total: int,
+                interval: int,
+                migrants: int,
+                unit: str,
+                workers: Optional[int] = None,
+                seed: Optional[int] = None,
+                deadline: Optional[float] = None) -> Tuple[Optional[Board], Dict]:
+    """
+    Island driver shared by the stochastic solvers.
+
+    island_fn(population, *epoch_args(done, epoch), seed) runs one island for epoch units
+    (generations or steps) and returns (population, best h of every unit). It is run for every
+    island in a process pool, then migrate_ring moves the best boards to the next island.
+    - total = number of units to run, interval = units between migrations
+    - workers = 1 runs the islands in this process (no pool)
+    - deadline = wall-clock budget in seconds, checked between migrations
+
+    Return values:
+    - (solution_board, stats) if a board with no attacking pairs is found
+    - (None, stats) otherwise, stats["best_board"] still holds the best board seen
+    stats has <unit>s, elapsed, <unit>s_per_sec, evaluations_per_sec (boards per second over all
+    islands), best_h, best_board, best_h_history (elapsed seconds, <unit>, best h) and best_h_per_<unit>.
+    """
+    stop_at = None if deadline is None else time.monotonic() + deadline
+    root_seed = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(root_seed.spawn(1)[0])
+    populations = [random_population(size, n, rng) for _ in range(islands)]
+
+    started = time.perf_counter()
+    done = 0
+    per_unit: List[int] = []
+    history: List[Tuple[float, int, int]] = []
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 and islands > 1 else None
+    run = pool.map if pool is not None else map
+    try:
+        fitness = [attacking_pairs_batch(p) for p in populations]
+        history.append((0.0, 0, int(min(h.min() for h in fitness))))
+
+        while done < total and history[-1][2] > 0:
+            if stop_at is not None and time.monotonic() >= stop_at:
+                break
+            epoch = min(interval, total - done)
+            args = epoch_args(done, epoch)
+            results = list(run(island_fn, populations,
+                               *([arg] * islands for arg in args), root_seed.spawn(islands)))
+            populations = [population for population, _ in results]
+            fitness = [attacking_pairs_batch(p) for p in populations]
+
+            # islands that solved early report fewer units, pad with their final best
+            ran = max(len(h) for _, h in results)
+            for i in range(ran):
+                per_unit.append(min(h[min(i, len(h) - 1)] if h else int(f.min())
+                                    for (_, h), f in zip(results, fitness)))
+            done += ran
+            history.append((time.perf_counter() - started, done,
+                           int(min(h.min() for h in fitness))))
+
+            migrate_ring(populations, fitness, migrants)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    elapsed = time.perf_counter() - started
+    best_island = min(range(islands), key=lambda i: fitness[i].min())
+    best_board = populations[best_island][int(np.argmin(fitness[best_island]))].tolist()
+    best_h = int(fitness[best_island].min())
+    stats = {
+        f"{unit}s": done,
+        "elapsed": elapsed,
+        f"{unit}s_per_sec": done / elapsed if elapsed > 0 else 0.0,
+        "evaluations_per_sec": done * islands * size / elapsed if elapsed > 0 else 0.0,
+        "best_h": best_h,
+        "best_board": best_board,
+        "best_h_history": history,
+        f"best_h_per_{unit}": per_unit,
+    }
+    return (best_board if best_h == 0 else None), stats
@@ -1,194 +1,70 @@
-import tkinter as tk
-from tkinter import messagebox
+from __future__ import annotations
+import time
+started = time.perf_counter()  # before every other import, so --timing includes the solver modules
+
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Tuple, Optional
-from PIL import Image, ImageTk, Image
+import os
+import sys
+import tempfile
 
 from src.core.heuristic import attacking_pairs
-from src.algorithms.astar import a_star
+from src.algorithms.steps import (steps_from_astar, steps_from_astar_per_cell,
+                                  steps_from_backtracking, steps_from_backtracking_compact)
+
+# tkinter and PIL are imported only when the window is created, so importing this
+# module (or the step builders) stays cheap and works on headless machines.
 
 board_size = 8
 cell_size = 60
 padding = 12
 
+icons_dir = Path(__file__).resolve().parents[2] / "assets" / "icons"
+icon_cache_dir = icons_dir / ".cache"
 
-# ----------------------------- A* (row-level, compact) ------------------------
-def steps_from_astar(start_state: List[int]) -> List[dict]:
-    path, *_ = a_star(start_state)  # accept either 2-tuple or 3-tuple
-    if not path:
-        return [{
-            "type": "error", "state": start_state.copy(), "row": -1, "col": -1,
-            "h": attacking_pairs(start_state)
-        }]
-
-    n = len(path[0])
-    shown = path[0].copy()  # show initial state fully
-    steps: List[dict] = []
-
-    steps.append({"type": "start", "state": shown.copy(), "row": -1, "col": -1,
-                  "h": attacking_pairs(path[0])})
-
-    for i in range(1, len(path)):
-        prev_board, cur_board = path[i - 1], path[i]
-        diffs = [r for r in range(n) if cur_board[r] != prev_board[r]]
-        if not diffs:
-            continue
-        for r in diffs:
-            shown[r] = cur_board[r]
-            steps.append({
-                "type": "move",
-                "state": shown.copy(),
-                "row": r,
-                "col": cur_board[r],
-                "h": attacking_pairs(cur_board),
-            })
-
-    steps.append({"type": "done", "state": shown.copy(),
-                 "row": -1, "col": -1, "h": 0})
-    return steps
-
-
-# ----------------------------- A* (per-cell, detailed) ------------------------
-def steps_from_astar_per_cell(start_state: List[int]) -> List[dict]:
-    # Use the path returned by a_star, ignore any extra returns safely
-    result = a_star(start_state)
-    path = result[0] if result else []
-
-    if not path:
-        return [{
-            "type": "error", "state": start_state.copy(), "row": -1, "col": -1,
-            "h": attacking_pairs(start_state)
-        }]
-
-    n = len(path[0])
-    shown = path[0].copy()
-    steps: List[dict] = []
-    steps.append({"type": "start", "state": shown.copy(), "row": -1, "col": -1,
-                  "h": attacking_pairs(path[0])})
-
-    for i in range(1, len(path)):
-        prev_board, cur_board = path[i - 1], path[i]
-        diffs = [row for row in range(n) if cur_board[row] != prev_board[row]]
-        if not diffs:
-            continue
-
-        for row in diffs:
-            target_col = cur_board[row]
-            # sweep previews across the row
-            for col in range(n):
-                temp = shown.copy()
-                temp[row] = col
-                steps.append({
-                    "type": "discover",
-                    "state": temp,
-                    "row": row,
-                    "col": col,
-                    "h": attacking_pairs(cur_board),
-                    "g": None,
-                    "f": None,
-                })
-            # commit
-            shown[row] = target_col
-            steps.append({
-                "type": "expand",
-                "state": shown.copy(),
-                "row": row,
-                "col": target_col,
-                "h": attacking_pairs(cur_board),
-                "g": None,
-                "f": None,
-            })
-
-    steps.append({"type": "done", "state": shown.copy(),
-                 "row": -1, "col": -1, "h": 0})
-    return steps
-
-
-# ----------------------------- Backtracking (verbose) -------------------------
-def steps_from_backtracking(start_state: List[int]) -> List[dict]:
-    """
-    start_state may contain -1 for empty rows.
-    Honors fixed queens, fills the rest. Logs try/place/conflict/backtrack/done.
-    """
-    n = len(start_state)
-    board = start_state.copy()
-    steps: List[dict] = []
-
-    def is_safe(rows: int, cols: int) -> bool:
-        if cols == -1:
-            return False
-        for row in range(n):
-            col = board[row]
-            if row == rows:
-                continue  # skip the same row
-            if col == -1:
-                continue
-            if cols == col:
-                return False  # same column
-            if abs(rows - row) == abs(cols - col):
-                return False  # same diagonal
-        return True
-
-    # validate pre-placed queens
-    for row in range(n):
-        col = board[row]
-        if col != -1 and not is_safe(row, col):
-            steps.append({"type": "error", "state": board.copy(), "row": row, "col": col,
-                          "h": attacking_pairs(board)})
-            return steps
-
-    steps.append({"type": "start", "state": board.copy(), "row": -1, "col": -1,
-                  "h": attacking_pairs(board)})
-
-    def next_empty_row(from_row: int) -> int:
-        for rr in range(from_row, n):
-            if board[rr] == -1:
-                return rr
-        return n
-
-    def place_from(row_index: int) -> bool:
-        row = next_empty_row(row_index)
-        if row >= n:
-            steps.append({"type": "done", "state": board.copy(),
-                         "row": -1, "col": -1, "h": 0})
-            return True
-
-        for col in range(n):
-            steps.append({"type": "try", "state": board.copy(), "row": row, "col": col,
-                          "h": attacking_pairs(board)})
-            if is_safe(row, col):
-                board[row] = col
-                steps.append({"type": "place", "state": board.copy(), "row": row, "col": col,
-                              "h": attacking_pairs(board)})
-                if place_from(row + 1):
-                    return True
-                board[row] = -1
-                steps.append({"type": "backtrack", "state": board.copy(), "row": row, "col": col,
-                              "h": attacking_pairs(board)})
-            else:
-                steps.append({"type": "conflict", "state": board.copy(), "row": row, "col": col,
-                              "h": attacking_pairs(board)})
-        return False
-
-    place_from(0)
-    return steps
 
+@lru_cache(maxsize=None)
+def queen_icon_image(size: int):
+    """Return the queen icon scaled to size x size.
+    The LANCZOS resize runs once per size, the result is saved to assets/icons/.cache
+    and loaded from there on the next launch.
+    """
+    from PIL import Image
 
-# ------------------------ Backtracking (row-level, compact) -------------------
-def steps_from_backtracking_compact(start_state: List[int]) -> List[dict]:
-    verbose = steps_from_backtracking(start_state)
-    if not verbose:
-        return verbose
-    steps = [verbose[0]]  # keep 'start'
-    for s in verbose[1:]:
-        if s["type"] in ("place", "backtrack", "done", "error"):
-            steps.append(s)
-    return steps
+    cached = icon_cache_dir / f"queen_{size}.png"
+    source = icons_dir / "queen.png"
+    if cached.exists() and cached.stat().st_mtime >= source.stat().st_mtime:
+        try:
+            img = Image.open(cached)
+            img.load()
+            return img
+        except OSError:
+            pass  # unreadable or truncated cache file, scale the source again
+
+    img = Image.open(source).resize((size, size), Image.Resampling.LANCZOS)
+    tmp_name = None
+    try:
+        icon_cache_dir.mkdir(exist_ok=True)
+        # write to a temporary file first so an interrupted or concurrent launch
+        # never leaves a half-written icon under the final name
+        fd, tmp_name = tempfile.mkstemp(suffix=".png", dir=icon_cache_dir)
+        with os.fdopen(fd, "wb") as tmp:
+            img.save(tmp, format="PNG")
+        os.replace(tmp_name, cached)
+    except OSError:
+        # read-only checkout, keep the in-memory copy
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+    return img
 
 
 # ==============================================================================
 
 class QueensGUI:
     def __init__(self, root: tk.Tk):
+        import tkinter as tk
+
         self.root = root
         self.root.title("8-Queens, A* vs Backtracking")
 
@@ -210,9 +86,9 @@ class QueensGUI:
         self.use_astar_trace = tk.BooleanVar(value=False)
 
         # images
-        img = Image.open("assets/icons/queen.png").resize((cell_size - 10, cell_size - 10),
-                                                          Image.Resampling.LANCZOS)
-        self.queen_icon = ImageTk.PhotoImage(img)
+        from PIL import ImageTk
+
+        self.queen_icon = ImageTk.PhotoImage(queen_icon_image(cell_size - 10))
         self.overlay_img = None
 
         # canvas
@@ -444,6 +320,8 @@ class QueensGUI:
         return rows
 
     def check_answer(self):
+        from tkinter import messagebox
+
         if self.mode != "edit":
             messagebox.showinfo("Info", "You can check only in Edit mode.")
             return
@@ -495,9 +373,12 @@ class QueensGUI:
 
         # highlight active row during play
         if self.mode == "play" and 0 <= active_row < board_size:
-            overlay_img = Image.new(
-                "RGBA", (board_size * cell_size, cell_size), (255, 141, 161, 128))
-            self.overlay_img = ImageTk.PhotoImage(overlay_img)
+            if self.overlay_img is None:
+                from PIL import Image, ImageTk
+
+                overlay_img = Image.new(
+                    "RGBA", (board_size * cell_size, cell_size), (255, 141, 161, 128))
+                self.overlay_img = ImageTk.PhotoImage(overlay_img)
             y0 = padding + active_row * cell_size
             self.canvas.create_image(
                 padding, y0, anchor="nw", image=self.overlay_img)
@@ -570,8 +451,17 @@ class QueensGUI:
 
 
 def main():
+    import tkinter as tk
+
     root = tk.Tk()
     app = QueensGUI(root)
+    if "--timing" in sys.argv:
+        # cold-start check: from the first import of this module (solver modules, tkinter and PIL
+        # included) to the first drawn window, interpreter startup is not counted here
+        root.update()
+        print(f"time to first window: {time.perf_counter() - started:.3f}s (after interpreter startup)")
+        root.destroy()
+        return
     root.mainloop()
 
 